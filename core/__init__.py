@@ -18,8 +18,10 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 from .network_config import NetworkConfig
+from .network_status import NetworkStatus
 from .logger import Logger
 from .time_formatter import TimeFormatter
+from .option_parser import OptionParser
 from .task_scheduler import TaskScheduler, TaskState, ScheduledTask
 from .database_manager import DatabaseManager
 from .plugin_manager import PluginManager
@@ -29,8 +31,10 @@ from .network_manager import NetworkManager
 
 __all__ = [
     'NetworkConfig',
+    'NetworkStatus',
     'Logger',
     'TimeFormatter',
+    'OptionParser',
     'TaskScheduler',
     'TaskState',
     'ScheduledTask',
@@ -17,7 +17,7 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 from pathlib import Path
 import sqlite3
 
@@ -26,7 +26,7 @@ from .network_config import NetworkConfig
 
 
 class DatabaseManager:
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Union[str, Path]):
         self.db_path = db_path
         self.connection: Optional[sqlite3.Connection] = None
         self.cursor: Optional[sqlite3.Cursor] = None
@@ -43,39 +43,45 @@ class DatabaseManager:
 
     def get_networks(self) -> List[NetworkConfig]:
         self.cursor.execute('SELECT * FROM irc_networks')
-        networks = []
+        return [self._row_to_network(row) for row in self.cursor.fetchall()]
 
-        for row in self.cursor.fetchall():
-            config = NetworkConfig(
-                id=row[0],
-                name=row[1],
-                addresses=row[2].split(', ') if row[2] else [],
-                ports=[int(p) for p in row[3].split(', ')] if row[3] else [],
-                ssl_ports=[int(p) for p in row[4].split(', ')] if row[4] else [],
-                enable_ssl=(row[5] == 1),
-                auto_connect=(row[6] == 1),
-                auto_reconnect=(row[7] == 1),
-                nicknames=row[8].split(', ') if row[8] else [],
-                ident=row[9],
-                realname=row[10],
-                auth_mechanism=row[11],
-                sasl_mechanism=row[12],
-                auth_username=row[13],
-                auth_password=row[14],
-                oper_auth=(row[15] == 1),
-                oper_username=row[16],
-                oper_password=row[17],
-                command_prefix=row[18],
-                rpl_welcome=row[19],
-                rpl_yourhost=row[20],
-                rpl_created=row[21],
-                rpl_myinfo=row[22],
-                rpl_isupport=row[23],
-                rpl_visiblehost=row[24]
-            )
-            networks.append(config)
-
-        return networks
+    def get_network(self, network_id: int) -> Optional[NetworkConfig]:
+        self.cursor.execute(
+            'SELECT * FROM irc_networks WHERE id=?',
+            (network_id,)
+        )
+        row = self.cursor.fetchone()
+        return self._row_to_network(row) if row else None
+
+    @staticmethod
+    def _row_to_network(row: tuple) -> NetworkConfig:
+        return NetworkConfig(
+            id=row[0],
+            name=row[1],
+            addresses=row[2].split(', ') if row[2] else [],
+            ports=[int(p) for p in row[3].split(', ')] if row[3] else [],
+            ssl_ports=[int(p) for p in row[4].split(', ')] if row[4] else [],
+            enable_ssl=(row[5] == 1),
+            auto_connect=(row[6] == 1),
+            auto_reconnect=(row[7] == 1),
+            nicknames=row[8].split(', ') if row[8] else [],
+            ident=row[9],
+            realname=row[10],
+            auth_mechanism=row[11],
+            sasl_mechanism=row[12],
+            auth_username=row[13],
+            auth_password=row[14],
+            oper_auth=(row[15] == 1),
+            oper_username=row[16],
+            oper_password=row[17],
+            command_prefix=row[18],
+            rpl_welcome=row[19],
+            rpl_yourhost=row[20],
+            rpl_created=row[21],
+            rpl_myinfo=row[22],
+            rpl_isupport=row[23],
+            rpl_visiblehost=row[24]
+        )
 
     def add_network(
         self,
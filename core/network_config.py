@@ -20,6 +20,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 from __future__ import annotations
 from typing import List, Optional
 from dataclasses import dataclass
+from functools import cached_property
 
 
 @dataclass
@@ -50,6 +51,20 @@ class NetworkConfig:
     rpl_isupport: Optional[str] = None
     rpl_visiblehost: Optional[str] = None
 
+    # Display strings, computed once per config object. Updates swap in a
+    # new NetworkConfig, which starts with an empty cache.
+    @cached_property
+    def addresses_csv(self) -> str:
+        return ', '.join(self.addresses)
+
+    @cached_property
+    def ports_csv(self) -> str:
+        return ', '.join(map(str, self.ports))
+
+    @cached_property
+    def ssl_ports_csv(self) -> str:
+        return ', '.join(map(str, self.ssl_ports))
+
     @property
     def primary_nickname(self) -> str:
         return self.nicknames[0] if self.nicknames else "Dunamis"
@@ -17,11 +17,13 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Any, KeysView
+from dataclasses import replace
 from twisted.internet import reactor, ssl
 
 from .logger import Logger
 from .network_config import NetworkConfig
+from .network_status import NetworkStatus
 from .database_manager import DatabaseManager
 from .factory import Factory
 from .plugin_manager import PluginManager
@@ -36,6 +38,10 @@ class NetworkManager:
         self.connected_addresses: Dict[int, tuple] = {}
         self.plugin_manager = PluginManager()
 
+    @property
+    def connected_ids(self) -> KeysView:
+        return self.connectors.keys()
+
     def load_networks(self) -> List[NetworkConfig]:
         networks = self.db.get_networks()
         for network in networks:
@@ -43,6 +49,31 @@ class NetworkManager:
         Logger.info(f"Loaded {len(networks)} network configurations")
         return networks
 
+    def apply_network_add(self, network_id: int,
+                          network: Optional[NetworkConfig]) -> bool:
+        if network is None:
+            Logger.warning(f"Network {network_id} not found in database")
+            return False
+
+        self.networks[network_id] = network
+        return True
+
+    def apply_network_update(self, network_id: int,
+                             updates: Dict[str, Any]) -> bool:
+        if network_id not in self.networks:
+            Logger.warning(f"Network {network_id} not loaded")
+            return False
+
+        # Swap in a new config so a live connection keeps the one it
+        # started with until it reconnects
+        fields = {key: value for key, value in updates.items()
+                  if hasattr(self.networks[network_id], key)}
+        self.networks[network_id] = replace(self.networks[network_id], **fields)
+        return True
+
+    def apply_network_remove(self, network_id: int) -> bool:
+        return self.networks.pop(network_id, None) is not None
+
     def connect_network(self, network_id: int, address_idx: int = 0,
                        port_idx: int = 0) -> bool:
         if network_id not in self.networks:
@@ -138,43 +169,44 @@ class NetworkManager:
 
         return self.connect_network(network_id)
 
-    def get_network_status(self, network_id: int) -> Optional[Dict]:
+    def get_network_status(self, network_id: int) -> Optional[NetworkStatus]:
         if network_id not in self.networks:
             return None
 
         network = self.networks[network_id]
         is_connected = network_id in self.connectors
 
-        status = {
-            "id": network.id,
-            "name": network.name,
-            "addresses": network.addresses,
-            "ports": network.ports,
-            "ssl_ports": network.ssl_ports,
-            "ssl": network.enable_ssl,
-            "auto_connect": network.auto_connect,
-            "auto_reconnect": network.auto_reconnect,
-            "connected": is_connected,
-            "auth_mechanism": network.auth_mechanism,
-        }
+        status = NetworkStatus(
+            id=network.id,
+            name=network.name,
+            addresses=network.addresses,
+            ports=network.ports,
+            ssl_ports=network.ssl_ports,
+            ssl=network.enable_ssl,
+            auto_connect=network.auto_connect,
+            auto_reconnect=network.auto_reconnect,
+            connected=is_connected,
+            auth_mechanism=network.auth_mechanism,
+            addresses_csv=network.addresses_csv,
+            ports_csv=network.ports_csv,
+            ssl_ports_csv=network.ssl_ports_csv,
+        )
 
         # Add connected server info if connected
         if is_connected and network_id in self.connected_addresses:
-            address, port = self.connected_addresses[network_id]
-            status["connected_address"] = address
-            status["connected_port"] = port
+            status.connected_address, status.connected_port = self.connected_addresses[network_id]
 
         if is_connected and network_id in self.factories:
             factory = self.factories[network_id]
             if hasattr(factory, 'protocol') and factory.protocol:
                 proto = factory.protocol
-                status["nickname"] = getattr(proto, 'nickname', None)
-                status["channels"] = getattr(proto, 'joined_channels', [])
-                status["sasl_authenticated"] = getattr(proto, 'sasl_authenticated', False)
+                status.nickname = getattr(proto, 'nickname', None)
+                status.channels = getattr(proto, 'joined_channels', [])
+                status.sasl_authenticated = getattr(proto, 'sasl_authenticated', False)
 
         return status
 
-    def list_networks(self) -> List[Dict]:
+    def list_networks(self) -> List[NetworkStatus]:
         return [self.get_network_status(net_id) for net_id in self.networks.keys()]
 
     def connect_all(self):
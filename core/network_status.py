@@ -0,0 +1,44 @@
+"""
+Dunamis IRC Bot - Network Status
+
+Copyright (C) 2026 Helenah, Helena Bolan <helenah2025@proton.me>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from __future__ import annotations
+from typing import List, Optional
+from dataclasses import dataclass, field
+
+
+@dataclass
+class NetworkStatus:
+    id: int
+    name: str
+    addresses: List[str]
+    ports: List[int]
+    ssl_ports: List[int]
+    ssl: bool
+    auto_connect: bool
+    auto_reconnect: bool
+    connected: bool
+    auth_mechanism: int
+    addresses_csv: str = ""
+    ports_csv: str = ""
+    ssl_ports_csv: str = ""
+    connected_address: Optional[str] = None
+    connected_port: Optional[int] = None
+    nickname: Optional[str] = None
+    channels: List[str] = field(default_factory=list)
+    sasl_authenticated: bool = False
@@ -0,0 +1,76 @@
+"""
+Dunamis IRC Bot - Option Parser
+
+Copyright (C) 2026 Helenah, Helena Bolan <helenah2025@proton.me>
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from typing import List, Dict, Tuple, Callable, Optional, Any
+from getopt import GetoptError
+
+
+# Maps a flag such as "-i" or "--interval" to the key its value is stored
+# under and the converter applied to the value. A converter of None marks
+# a flag that takes no value and stores True.
+OptionTable = Dict[str, Tuple[str, Optional[Callable[[str], Any]]]]
+
+
+class OptionParser:
+    @staticmethod
+    def parse(args: List[str],
+              table: OptionTable) -> Tuple[Dict[str, Any], List[str]]:
+        values = {}
+        i = 0
+
+        while i < len(args):
+            arg = args[i]
+
+            if arg == "--":
+                i += 1
+                break
+            if not arg.startswith("-") or arg == "-":
+                break
+
+            # Long options may carry "=value", short options an attached value
+            if arg.startswith("--"):
+                flag, attached, value = arg.partition("=")
+            else:
+                flag, value = arg[:2], arg[2:]
+                attached = bool(value)
+
+            option = table.get(flag)
+            if option is None:
+                raise GetoptError(f"option {flag} not recognized", flag)
+
+            key, convert = option
+
+            if convert is None:
+                if attached:
+                    raise GetoptError(f"option {flag} must not have an argument", flag)
+                values[key] = True
+            else:
+                if not attached:
+                    i += 1
+                    if i >= len(args):
+                        raise GetoptError(f"option {flag} requires argument", flag)
+                    value = args[i]
+                try:
+                    values[key] = convert(value)
+                except ValueError as e:
+                    raise ValueError(f"option {flag}: {e}") from e
+
+            i += 1
+
+        return values, args[i:]
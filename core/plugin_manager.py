@@ -17,8 +17,9 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Tuple, Pattern
 from pathlib import Path
+import re
 from importlib.util import spec_from_file_location, module_from_spec
 
 from .logger import Logger
@@ -31,6 +32,15 @@ class PluginManager:
         self.loaded_plugins: dict[str, Any] = {}
         self.commands: dict[str, Callable] = {}
         self.values: dict[str, Callable] = {}
+        self._sorted_commands: Optional[Tuple[str, ...]] = None
+        self._values_pattern: Optional[Pattern[str]] = None
+
+    @property
+    def sorted_commands(self) -> Tuple[str, ...]:
+        # Rebuilt only after plugins register or unregister commands
+        if self._sorted_commands is None:
+            self._sorted_commands = tuple(sorted(self.commands))
+        return self._sorted_commands
 
     def load_plugin(self, plugin_name: str) -> bool:
         if plugin_name in self.loaded_plugins:
@@ -78,6 +88,9 @@ class PluginManager:
         return True
 
     def _register_plugin_features(self, plugin_name: str, plugin: Any):
+        self._sorted_commands = None
+        self._values_pattern = None
+
         for attr_name in dir(plugin):
             if attr_name.startswith("command_"):
                 cmd_name = attr_name.replace("command_", "")
@@ -90,6 +103,9 @@ class PluginManager:
                 Logger.info(f"Registered value: {val_name}")
 
     def _unregister_plugin_features(self, plugin: Any):
+        self._sorted_commands = None
+        self._values_pattern = None
+
         for attr_name in dir(plugin):
             if attr_name.startswith("command_"):
                 cmd_name = attr_name.replace("command_", "")
@@ -108,9 +124,23 @@ class PluginManager:
         return False
 
     def parse_values(self, message: str, context: Any) -> str:
-        for val_name, val_func in self.values.items():
-            placeholder = f"${val_name}"
-            if placeholder in message:
-                value = val_func(context)
-                message = message.replace(placeholder, value)
-        return message
+        if "$" not in message or not self.values:
+            return message
+
+        # Longest names first, so "$name" never shadows "$name_suffix"
+        if self._values_pattern is None:
+            names = sorted(self.values, key=len, reverse=True)
+            self._values_pattern = re.compile(
+                r"\$(" + "|".join(map(re.escape, names)) + ")")
+
+        # Each value is computed at most once per message
+        resolved: dict[str, str] = {}
+
+        def substitute(match):
+            val_name = match.group(1)
+            value = resolved.get(val_name)
+            if value is None:
+                value = resolved[val_name] = self.values[val_name](context)
+            return value
+
+        return self._values_pattern.sub(substitute, message)
@@ -279,11 +279,32 @@ class Protocol(irc.IRCClient):
 
     def send_message(self, target: str, message: str,
                      prefix_nick: Optional[str] = None):
-        if prefix_nick:
-            message = f"{prefix_nick}: {message}"
+        self.send_messagev(target, message.split('\n'), prefix_nick)
+
+    def send_messagev(self, target: str, lines: List[str],
+                      prefix_nick: Optional[str] = None):
+        # Like send_message, address the nick on the first line only
+        if prefix_nick and lines:
+            lines = [f"{prefix_nick}: {lines[0]}", *lines[1:]]
+
+        # Throttled output has to go through the line queue one at a time
+        if self.lineRate is not None:
+            for line in lines:
+                self.msg(target, line)
+            return
+
+        # Same splitting as IRCClient.msg, but coalesced into one write
+        fmt = f"PRIVMSG {target} :"
+        length = self._safeMaximumLineLength(fmt) - len(fmt) - 2
+        buffer = bytearray()
+
+        for line in lines:
+            for chunk in irc.split(line, length):
+                buffer += irc.lowQuote(fmt + chunk).encode('utf-8')
+                buffer += b'\r\n'
 
-        for line in message.split('\n'):
-            self.msg(target, line)
+        if buffer:
+            self.transport.write(bytes(buffer))
 
     def privmsg(self, user: str, channel: str, message: str):
         try:
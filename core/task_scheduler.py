@@ -318,6 +318,10 @@ class TaskScheduler:
         plugin_name: Optional[str] = None,
         state: Optional[TaskState] = None
     ) -> List[ScheduledTask]:
+        # No filters: copy the task table without testing each task
+        if not plugin_name and not state:
+            return list(self.tasks.values())
+
         result = []
         for scheduled_task in self.tasks.values():
             if plugin_name and scheduled_task.plugin_name != plugin_name:
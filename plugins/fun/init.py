@@ -22,9 +22,10 @@ from typing import List, Dict, Tuple
 from random import randint
 from getopt import getopt, GetoptError
 from datetime import datetime
+from html import unescape
+import re
 
 try:
-    from bs4 import BeautifulSoup
     from requests import get
     REQUESTS_AVAILABLE = True
 except ImportError:
@@ -78,6 +79,23 @@ DIGIT_STYLES = {
 
 DEFAULT_STYLE = 'block'
 
+# Braille pattern blank, used in place of spaces so IRC clients don't
+# collapse the whitespace in rendered art
+BRAILLE_BLANK = '\u2800'
+
+# Style registry with spaces pre-substituted by the braille blank
+DIGIT_STYLES_BRAILLE_BLANK = {
+    name: {
+        char: tuple(row.replace(' ', BRAILLE_BLANK) for row in rows)
+        for char, rows in char_map.items()
+    }
+    for name, char_map in DIGIT_STYLES.items()
+}
+
+# First link on developerexcuses.com holds the excuse text
+_EXCUSE_RE = re.compile(rb'<a\b[^>]*>(.*?)</a>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(rb'<[^>]*>')
+
 
 # Border styles
 BORDER_STYLES = {
@@ -110,65 +128,62 @@ def add_border(lines: List[str], border_style: str) -> List[str]:
     border = BORDER_STYLES[border_style]
 
     # Calculate the width needed (longest line)
-    max_width = max(len(line) for line in lines)
-
-    # Pad all lines to same width
-    padded_lines = [line + ' ' * (max_width - len(line)) for line in lines]
-
-    # Create bordered output
-    bordered = []
+    max_width = max(map(len, lines))
+    horizontal = border['h'] * (max_width + 2)
+    left = border['v'] + ' '
+    right = ' ' + border['v']
 
-    # Top border
-    bordered.append(border['tl'] + border['h'] * (max_width + 2) + border['tr'])
-
-    # Content with side borders
-    for line in padded_lines:
-        bordered.append(border['v'] + ' ' + line + ' ' + border['v'])
-
-    # Bottom border
-    bordered.append(border['bl'] + border['h'] * (max_width + 2) + border['br'])
+    # Top border, content padded to the same width with side borders,
+    # then bottom border, built in a single list
+    bordered = [border['tl'] + horizontal + border['tr']]
+    bordered.extend([left + line.ljust(max_width) + right for line in lines])
+    bordered.append(border['bl'] + horizontal + border['br'])
 
     return bordered
 
 
 def render_ascii_text(
-        text: str, char_map: Dict[str, Tuple[str, ...]]) -> List[str]:
+        text: str, char_map: Dict[str, Tuple[str, ...]],
+        separator: str = ' ') -> List[str]:
     # Filter text to only include supported characters
     filtered_text = ''.join(c for c in text if c in char_map)
 
     if not filtered_text:
         return []
 
+    # A single glyph needs no joining
+    if len(filtered_text) == 1:
+        return list(char_map[filtered_text])
+
     # Get ASCII representation for each character
     char_art = [char_map[char] for char in filtered_text]
 
-    # Combine horizontally (assuming all have same height)
-    height = len(char_art[0])
-    lines = []
-
-    for row in range(height):
-        line_parts = [art[row] for art in char_art]
-        lines.append(' '.join(line_parts))
-
-    return lines
+    # Combine horizontally (assuming all have same height), zip transposes
+    # the glyphs into rows without a Python-level index loop
+    return [separator.join(row) for row in zip(*char_art)]
 
 
 def fetch_developer_excuse() -> str:
     if not REQUESTS_AVAILABLE:
-        return "Required libraries (requests, beautifulsoup4) not available"
+        return "Required library (requests) not available"
 
     try:
         response = get('http://developerexcuses.com/', timeout=5)
-        response.raise_for_status()
+        if response.status_code >= 400:
+            return f"Failed to fetch excuse: HTTP {response.status_code}"
 
-        soup = BeautifulSoup(response.text, features="html.parser")
-        elem = soup.find('a')
+        # Match on the raw bytes and decode once, skipping charset detection
+        match = _EXCUSE_RE.search(response.content)
 
-        if elem and elem.text:
-            # Handle encoding issues gracefully
-            return elem.text.encode('ascii', 'ignore').decode()
-        else:
-            return "Could not parse excuse from website"
+        if match:
+            # Text of the first link, like BeautifulSoup's elem.text: drop
+            # inner tags, decode entities, then keep the reply ASCII-only
+            text = _TAG_RE.sub(b'', match.group(1)).decode('utf-8', 'replace')
+            excuse = unescape(text).encode('ascii', 'ignore').decode()
+            if excuse:
+                return excuse
+
+        return "Could not parse excuse from website"
 
     except Exception as e:
         return f"Failed to fetch excuse: {str(e)}"
@@ -206,16 +221,15 @@ def format_dice_results(count: int, sides: int, results: List[int]) -> str:
 
     # For multiple dice
     total = sum(results)
-    results_str = results[:-1]
     last_result = results[-1]
 
     if count == 2:
         return (
             f"You rolled {count} dice with {sides} sides and got "
-            f"a {results_str[0]} and a {last_result}. Total: {total}"
+            f"a {results[0]} and a {last_result}. Total: {total}"
         )
     else:
-        result_list = ", ".join(str(r) for r in results_str)
+        result_list = ", ".join(map(str, results[:-1]))
         return (
             f"You rolled {count} dice with {sides} sides and got "
             f"{result_list}, and a {last_result}. Total: {total}"
@@ -281,12 +295,12 @@ def command_digits(bot, target: str, nickname: str, args: List[str]):
         return
 
     # Render and send ASCII art
-    char_map = DIGIT_STYLES[style]
-    lines = render_ascii_text(digits_only, char_map)
-
-    # Replace spaces with braille blank if requested
+    # Use braille blanks in place of spaces if requested
     if use_braille_blank:
-        lines = [line.replace(' ', '\u2800') for line in lines]
+        lines = render_ascii_text(
+            digits_only, DIGIT_STYLES_BRAILLE_BLANK[style], BRAILLE_BLANK)
+    else:
+        lines = render_ascii_text(digits_only, DIGIT_STYLES[style])
 
     # Add border if requested
     if border_style:
@@ -344,18 +358,18 @@ def command_digiclock(bot, target: str, nickname: str, args: List[str]):
         else:
             now = datetime.now()
 
-        time_str = now.strftime('%H:%M:%S')
+        time_str = f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}"
     except Exception as e:
         bot.send_message(target, f"Error getting time: {e}", nickname)
         return
 
     # Render and send ASCII art
-    char_map = DIGIT_STYLES[style]
-    lines = render_ascii_text(time_str, char_map)
-
-    # Replace spaces with braille blank if requested
+    # Use braille blanks in place of spaces if requested
     if use_braille_blank:
-        lines = [line.replace(' ', '\u2800') for line in lines]
+        lines = render_ascii_text(
+            time_str, DIGIT_STYLES_BRAILLE_BLANK[style], BRAILLE_BLANK)
+    else:
+        lines = render_ascii_text(time_str, DIGIT_STYLES[style])
 
     # Add border if requested
     if border_style:
@@ -444,7 +458,11 @@ def command_coin(bot, target: str, nickname: str, args: List[str]):
     if coin_count == 1:
         bot.send_message(target, f"You flipped: {results[0]}", nickname)
     else:
-        result_str = ', '.join(results[:-1]) + f', and {results[-1]}'
+        if coin_count == 2:
+            result_str = f"{results[0]} and {results[1]}"
+        else:
+            head = ', '.join(results[:-1])
+            result_str = f"{head}, and {results[-1]}"
         summary = f"Heads: {heads_count}, Tails: {tails_count}"
         bot.send_message(
             target,
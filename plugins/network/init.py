@@ -18,8 +18,10 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from typing import List
-from getopt import getopt, GetoptError
+from typing import List, Optional
+from getopt import GetoptError
+
+from core import OptionParser, NetworkStatus
 
 
 PLUGIN_INFO = {
@@ -29,6 +31,17 @@ PLUGIN_INFO = {
     "description": "IRC network management commands"
 }
 
+# Indexed by NetworkConfig.auth_mechanism
+_AUTH_NAMES = ("None", "SASL", "NickServ", "Custom")
+
+# Accepted spellings for boolean option values, listed in every casing we
+# accept so no case folding is needed per flag
+_TRUTHY = frozenset({
+    'true', 'True', 'TRUE',
+    'yes', 'Yes', 'YES',
+    '1', 't', 'T', 'y', 'Y',
+})
+
 
 def get_network_manager(bot):
     if hasattr(bot, 'factory') and hasattr(bot.factory, 'network_manager'):
@@ -36,61 +49,111 @@ def get_network_manager(bot):
     return None
 
 
-def format_network_info(status: dict) -> str:
-    parts = [
-        f"ID: {status['id']}",
-        f"Name: {status['name']}",
-        f"Addresses: {', '.join(status['addresses'])}",
-    ]
+def _truthy(value: str) -> bool:
+    return value in _TRUTHY
 
-    # Show both port lists
-    if status.get('ports'):
-        parts.append(f"Standard Ports: {', '.join(map(str, status['ports']))}")
-    if status.get('ssl_ports'):
-        parts.append(f"SSL Ports: {', '.join(map(str, status['ssl_ports']))}")
 
-    parts.extend([
-        f"SSL: {'Yes' if status['ssl'] else 'No'}",
-        f"Auto-connect: {'Yes' if status['auto_connect'] else 'No'}",
-        f"Auto-reconnect: {'Yes' if status['auto_reconnect'] else 'No'}",
-        f"Connection Status: {'Connected' if status['connected'] else 'Disconnected'}",
-    ])
+def _csv_strs(value: str) -> List[str]:
+    return value.replace(' ', '').split(',')
 
-    # Show connected server if connected
-    if status.get('connected_address'):
-        parts.append(f"Connected to: {status['connected_address']}:{status['connected_port']}")
 
-    # Auth mechanism
-    auth_names = {0: "None", 1: "SASL", 2: "NickServ", 3: "Custom"}
-    parts.append(f"Authentication Mechanism: {auth_names.get(status['auth_mechanism'], 'Unknown')}")
+def _csv_ints(value: str) -> List[int]:
+    return list(map(_integer, value.replace(' ', '').split(',')))
 
-    if status.get('nickname'):
-        parts.append(f"Nickname: {status['nickname']}")
 
-    if status.get('sasl_authenticated'):
-        parts.append(f"SASL: Authenticated")
+def _integer(value: str) -> int:
+    if not value.isdecimal():
+        raise ValueError(f"'{value}' is not an integer")
+    return int(value)
+
+
+# OptionParser tables for "network add" and "network modify", keyed by the
+# network field each flag sets
+_ADD_OPTIONS = {
+    "-a": ("addresses", _csv_strs),
+    "--addresses": ("addresses", _csv_strs),
+    "-p": ("ports", _csv_ints),
+    "--ports": ("ports", _csv_ints),
+    "--ssl-ports": ("ssl_ports", _csv_ints),
+    "-s": ("enable_ssl", _truthy),
+    "--ssl": ("enable_ssl", _truthy),
+    "--auto-connect": ("auto_connect", _truthy),
+    "--auto-reconnect": ("auto_reconnect", _truthy),
+    "--nick": ("nicknames", _csv_strs),
+    "--ident": ("ident", str),
+    "--realname": ("realname", str),
+    "--auth-user": ("auth_username", str),
+    "--auth-pass": ("auth_password", str),
+    "--auth-mech": ("auth_mechanism", _integer),
+    "--sasl-mech": ("sasl_mechanism", _integer),
+    "--oper": ("oper_auth", None),
+    "--oper-user": ("oper_username", str),
+    "--oper-pass": ("oper_password", str),
+    "--prefix": ("command_prefix", str),
+}
+
+_MODIFY_OPTIONS = {
+    **_ADD_OPTIONS,
+    "-n": ("name", str),
+    "--name": ("name", str),
+    "--oper": ("oper_auth", _truthy),
+}
+
+
+def _parse_network_id(bot, target: str, nickname: str, args: List[str],
+                      usage: str) -> Optional[int]:
+    if not args:
+        bot.send_message(target, f"Usage: {usage}", nickname)
+        return None
 
-    if status.get('channels'):
-        channel_list = ', '.join(status['channels'])
-        parts.append(f"Channels: {channel_list}")
+    try:
+        return int(args[0])
+    except ValueError:
+        bot.send_message(target, f"Error: invalid network ID: {args[0]}", nickname)
+        return None
+
+
+def format_network_info(status: NetworkStatus) -> str:
+    ports_csv = status.ports_csv
+    ssl_ports_csv = status.ssl_ports_csv
+    connected_address = status.connected_address
+    nickname = status.nickname
+    channels = status.channels
+
+    auth_mechanism = status.auth_mechanism
+    auth_name = _AUTH_NAMES[auth_mechanism] if 0 <= auth_mechanism < len(_AUTH_NAMES) else "Unknown"
+
+    # Optional fields are None when absent and filtered out in the same pass
+    parts = [part for part in (
+        f"ID: {status.id}",
+        f"Name: {status.name}",
+        f"Addresses: {status.addresses_csv}",
+        f"Standard Ports: {ports_csv}" if ports_csv else None,
+        f"SSL Ports: {ssl_ports_csv}" if ssl_ports_csv else None,
+        f"SSL: {'Yes' if status.ssl else 'No'}",
+        f"Auto-connect: {'Yes' if status.auto_connect else 'No'}",
+        f"Auto-reconnect: {'Yes' if status.auto_reconnect else 'No'}",
+        f"Connection Status: {'Connected' if status.connected else 'Disconnected'}",
+        f"Connected to: {connected_address}:{status.connected_port}" if connected_address else None,
+        f"Authentication Mechanism: {auth_name}",
+        f"Nickname: {nickname}" if nickname else None,
+        "SASL: Authenticated" if status.sasl_authenticated else None,
+        f"Channels: {', '.join(channels)}" if channels else None,
+    ) if part is not None]
 
     return ', '.join(parts)
 
 
-def format_network_list(networks: List[dict]) -> str:
+def format_network_list(networks: List[NetworkStatus]) -> str:
     if not networks:
         return "No networks configured"
 
-    parts = []
-    for net in networks:
-        status = "Connected" if net['connected'] else "Disconnected"
-        parts.extend([
-            f"[ ID: {net['id']}, "
-            f"Name: {net['name']}, "
-            f"Status: {status} ]"
-        ])
-
-    return ' -- '.join(parts)
+    return ' -- '.join(
+        f"[ ID: {net.id}, "
+        f"Name: {net.name}, "
+        f"Status: {'Connected' if net.connected else 'Disconnected'} ]"
+        for net in networks
+    )
 
 
 def command_network(bot, target: str, nickname: str, args: List[str]):
@@ -100,24 +163,10 @@ def command_network(bot, target: str, nickname: str, args: List[str]):
         bot.send_message(target, "Error: network manager not available", nickname)
         return
 
-    handlers = {
-        "list": handle_list,
-        "info": handle_info,
-        "connect": handle_connect,
-        "disconnect": handle_disconnect,
-        "reconnect": handle_reconnect,
-        "current": handle_current,
-        "add": handle_add,
-        "remove": handle_remove,
-        "modify": handle_modify,
-    }
-
-    subcommand_list = ", ".join(handlers.keys())
-
     if not args:
         bot.send_message(
             target,
-            f"Usage: requires a subcommand: {subcommand_list}",
+            f"Usage: requires a subcommand: {_SUBCOMMAND_LIST}",
             nickname
         )
         return
@@ -125,36 +174,27 @@ def command_network(bot, target: str, nickname: str, args: List[str]):
     subcommand = args[0].lower()
     subargs = args[1:]
 
-    handler = handlers.get(subcommand)
+    handler = _HANDLERS.get(subcommand)
 
     if handler:
-        handler(bot, target, nickname, subargs)
+        handler(bot, network_manager, target, nickname, subargs)
     else:
         bot.send_message(
             target,
-            f"Error: unknown subcommand: {subcommand} - available: {subcommand_list}",
+            f"Error: unknown subcommand: {subcommand} - available: {_SUBCOMMAND_LIST}",
             nickname
         )
 
 
-def handle_list(bot, target: str, nickname: str, args: List[str]):
-    network_manager = get_network_manager(bot)
+def handle_list(bot, network_manager, target: str, nickname: str, args: List[str]):
     networks = network_manager.list_networks()
     output = format_network_list(networks)
     bot.send_message(target, output, nickname)
 
 
-def handle_info(bot, target: str, nickname: str, args: List[str]):
-    network_manager = get_network_manager(bot)
-
-    if not args:
-        bot.send_message(target, "Usage: network info NETWORK_ID", nickname)
-        return
-
-    try:
-        network_id = int(args[0])
-    except ValueError:
-        bot.send_message(target, f"Error: invalid network ID: {args[0]}", nickname)
+def handle_info(bot, network_manager, target: str, nickname: str, args: List[str]):
+    network_id = _parse_network_id(bot, target, nickname, args, "network info NETWORK_ID")
+    if network_id is None:
         return
 
     status = network_manager.get_network_status(network_id)
@@ -167,17 +207,9 @@ def handle_info(bot, target: str, nickname: str, args: List[str]):
     bot.send_message(target, output, nickname)
 
 
-def handle_connect(bot, target: str, nickname: str, args: List[str]):
-    network_manager = get_network_manager(bot)
-
-    if not args:
-        bot.send_message(target, "Usage: network connect NETWORK_ID", nickname)
-        return
-
-    try:
-        network_id = int(args[0])
-    except ValueError:
-        bot.send_message(target, f"Error: invalid network ID: {args[0]}", nickname)
+def handle_connect(bot, network_manager, target: str, nickname: str, args: List[str]):
+    network_id = _parse_network_id(bot, target, nickname, args, "network connect NETWORK_ID")
+    if network_id is None:
         return
 
     if network_manager.connect_network(network_id):
@@ -195,17 +227,9 @@ def handle_connect(bot, target: str, nickname: str, args: List[str]):
         )
 
 
-def handle_disconnect(bot, target: str, nickname: str, args: List[str]):
-    network_manager = get_network_manager(bot)
-
-    if not args:
-        bot.send_message(target, "Usage: network disconnect NETWORK_ID", nickname)
-        return
-
-    try:
-        network_id = int(args[0])
-    except ValueError:
-        bot.send_message(target, f"Error: invalid network ID: {args[0]}", nickname)
+def handle_disconnect(bot, network_manager, target: str, nickname: str, args: List[str]):
+    network_id = _parse_network_id(bot, target, nickname, args, "network disconnect NETWORK_ID")
+    if network_id is None:
         return
 
     if network_manager.disconnect_network(network_id):
@@ -223,17 +247,9 @@ def handle_disconnect(bot, target: str, nickname: str, args: List[str]):
         )
 
 
-def handle_reconnect(bot, target: str, nickname: str, args: List[str]):
-    network_manager = get_network_manager(bot)
-
-    if not args:
-        bot.send_message(target, "Usage: network reconnect NETWORK_ID", nickname)
-        return
-
-    try:
-        network_id = int(args[0])
-    except ValueError:
-        bot.send_message(target, f"Error: invalid network ID: {args[0]}", nickname)
+def handle_reconnect(bot, network_manager, target: str, nickname: str, args: List[str]):
+    network_id = _parse_network_id(bot, target, nickname, args, "network reconnect NETWORK_ID")
+    if network_id is None:
         return
 
     if network_manager.reconnect_network(network_id):
@@ -251,10 +267,8 @@ def handle_reconnect(bot, target: str, nickname: str, args: List[str]):
         )
 
 
-def handle_current(bot, target: str, nickname: str, args: List[str]):
-    network_manager = get_network_manager(bot)
-    network_id = bot.factory.config.id
-    status = network_manager.get_network_status(network_id)
+def handle_current(bot, network_manager, target: str, nickname: str, args: List[str]):
+    status = network_manager.get_network_status(bot.factory.config.id)
 
     if status is None:
         bot.send_message(target, "Error: current network not found", nickname)
@@ -264,7 +278,7 @@ def handle_current(bot, target: str, nickname: str, args: List[str]):
     bot.send_message(target, output, nickname)
 
 
-def handle_add(bot, target: str, nickname: str, args: List[str]):
+def handle_add(bot, network_manager, target: str, nickname: str, args: List[str]):
     if args:
         network_name = args[0]
         args = args[1:]
@@ -272,77 +286,9 @@ def handle_add(bot, target: str, nickname: str, args: List[str]):
         bot.send_message(target, "Usage: network add <network_name> <flags>", nickname)
         return
 
-    network_manager = get_network_manager(bot)
-
     # Parse options
-    addresses = None
-    ports = None
-    ssl_ports = None
-    enable_ssl = True
-    auto_connect = True
-    auto_reconnect = True
-    nicknames = None
-    ident = "dunamis"
-    realname = "Dunamis IRC Bot"
-    auth_user = ""
-    auth_pass = ""
-    auth_mech = 1  # SASL by default
-    sasl_mech = 1  # PLAIN by default
-    oper_auth = False
-    oper_user = ""
-    oper_pass = ""
-    prefix = "!"
-
     try:
-        opts, remaining = getopt(
-            args,
-            "a:p:s:",
-            [
-                "addresses=", "ports=", "ssl-ports=", "ssl=",
-                "auto-connect=", "auto-reconnect=",
-                "nick=", "ident=", "realname=",
-                "auth-user=", "auth-pass=", "auth-mech=", "sasl-mech=",
-                "oper", "oper-user=", "oper-pass=",
-                "prefix="
-            ]
-        )
-
-        for opt, arg in opts:
-            if opt in ("-a", "--addresses"):
-                addresses = [a.strip() for a in arg.split(',')]
-            elif opt in ("-p", "--ports"):
-                ports = [int(p.strip()) for p in arg.split(',')]
-            elif opt == "--ssl-ports":
-                ssl_ports = [int(p.strip()) for p in arg.split(',')]
-            elif opt in ("-s", "--ssl"):
-                enable_ssl = arg.lower() in ['true', 'yes', '1']
-            elif opt == "--auto-connect":
-                auto_connect = arg.lower() in ['true', 'yes', '1']
-            elif opt == "--auto-reconnect":
-                auto_reconnect = arg.lower() in ['true', 'yes', '1']
-            elif opt == "--nick":
-                nicknames = [n.strip() for n in arg.split(',')]
-            elif opt == "--ident":
-                ident = arg
-            elif opt == "--realname":
-                realname = arg
-            elif opt == "--auth-user":
-                auth_user = arg
-            elif opt == "--auth-pass":
-                auth_pass = arg
-            elif opt == "--auth-mech":
-                auth_mech = int(arg)
-            elif opt == "--sasl-mech":
-                sasl_mech = int(arg)
-            elif opt == "--oper":
-                oper_auth = True
-            elif opt == "--oper-user":
-                oper_user = arg
-            elif opt == "--oper-pass":
-                oper_pass = arg
-            elif opt == "--prefix":
-                prefix = arg
-
+        options, _ = OptionParser.parse(args, _ADD_OPTIONS)
     except GetoptError as e:
         bot.send_message(target, f"Error: invalid option: {e}", nickname)
         return
@@ -351,43 +297,17 @@ def handle_add(bot, target: str, nickname: str, args: List[str]):
         return
 
     # Validate required fields
-    if not addresses:
+    if not options.get('addresses'):
         bot.send_message(target, "Error: server address(es) required (-a ADDRESSES)", nickname)
         return
 
-    # Set defaults
-    if ports is None:
-        ports = [6667]
-    if ssl_ports is None:
-        ssl_ports = [6697]
-    if nicknames is None:
-        nicknames = ["Dunamis", "Dunamis_", "Dunamis__"]
-
     # Add network to database
     try:
-        network_id = bot.db.add_network(
-            name=network_name,
-            addresses=addresses,
-            ports=ports,
-            ssl_ports=ssl_ports,
-            enable_ssl=enable_ssl,
-            auto_connect=auto_connect,
-            auto_reconnect=auto_reconnect,
-            nicknames=nicknames,
-            ident=ident,
-            realname=realname,
-            auth_mechanism=auth_mech,
-            sasl_mechanism=sasl_mech,
-            auth_username=auth_user,
-            auth_password=auth_pass,
-            oper_auth=oper_auth,
-            oper_username=oper_user,
-            oper_password=oper_pass,
-            command_prefix=prefix
-        )
+        # Unset options fall back to the defaults in DatabaseManager.add_network
+        network_id = bot.db.add_network(name=network_name, **options)
 
-        # Reload networks in network manager
-        network_manager.load_networks()
+        # Add the new network to the network manager
+        network_manager.apply_network_add(network_id, bot.db.get_network(network_id))
 
         bot.send_message(
             target,
@@ -399,21 +319,13 @@ def handle_add(bot, target: str, nickname: str, args: List[str]):
         bot.send_message(target, f"Error: failed to add network: {e}", nickname)
 
 
-def handle_remove(bot, target: str, nickname: str, args: List[str]):
-    network_manager = get_network_manager(bot)
-
-    if not args:
-        bot.send_message(target, "Usage: network remove <channel_id>", nickname)
-        return
-
-    try:
-        network_id = int(args[0])
-    except ValueError:
-        bot.send_message(target, f"Error: invalid network ID: {args[0]}", nickname)
+def handle_remove(bot, network_manager, target: str, nickname: str, args: List[str]):
+    network_id = _parse_network_id(bot, target, nickname, args, "network remove <channel_id>")
+    if network_id is None:
         return
 
     # Don't allow removing currently connected networks
-    if network_id in network_manager.connectors:
+    if network_id in network_manager.connected_ids:
         bot.send_message(
             target,
             f"Error: cannot remove connected network. Disconnect first with 'network disconnect {network_id}'",
@@ -430,8 +342,7 @@ def handle_remove(bot, target: str, nickname: str, args: List[str]):
             network_name = str(network_id)
 
         if bot.db.remove_network(network_id):
-            # Reload networks
-            network_manager.load_networks()
+            network_manager.apply_network_remove(network_id)
             bot.send_message(
                 target,
                 f"Success: removed network ID '{network_id}' from database",
@@ -444,17 +355,9 @@ def handle_remove(bot, target: str, nickname: str, args: List[str]):
         bot.send_message(target, f"Error: failed to remove network: {e}", nickname)
 
 
-def handle_modify(bot, target: str, nickname: str, args: List[str]):
-    network_manager = get_network_manager(bot)
-
-    if not args:
-        bot.send_message(target, "Usage: network modify NETWORK_ID [OPTIONS]", nickname)
-        return
-
-    try:
-        network_id = int(args[0])
-    except ValueError:
-        bot.send_message(target, f"Error: invalid network ID: {args[0]}", nickname)
+def handle_modify(bot, network_manager, target: str, nickname: str, args: List[str]):
+    network_id = _parse_network_id(bot, target, nickname, args, "network modify NETWORK_ID [OPTIONS]")
+    if network_id is None:
         return
 
     remaining_args = args[1:]
@@ -464,69 +367,17 @@ def handle_modify(bot, target: str, nickname: str, args: List[str]):
         return
 
     # Parse modification options
-    updates = {}
-
     try:
-        opts, _ = getopt(
-            remaining_args,
-            "n:a:p:s:",
-            [
-                "name=", "addresses=", "ports=", "ssl-ports=", "ssl=",
-                "auto-connect=", "auto-reconnect=",
-                "nick=", "ident=", "realname=",
-                "auth-user=", "auth-pass=", "auth-mech=", "sasl-mech=",
-                "oper=", "oper-user=", "oper-pass=",
-                "prefix="
-            ]
-        )
-
-        for opt, arg in opts:
-            if opt in ("-n", "--name"):
-                updates['name'] = arg
-            elif opt in ("-a", "--addresses"):
-                updates['addresses'] = [a.strip() for a in arg.split(',')]
-            elif opt in ("-p", "--ports"):
-                updates['ports'] = [int(p.strip()) for p in arg.split(',')]
-            elif opt == "--ssl-ports":
-                updates['ssl_ports'] = [int(p.strip()) for p in arg.split(',')]
-            elif opt in ("-s", "--ssl"):
-                updates['enable_ssl'] = arg.lower() in ('true', 'yes', '1')
-            elif opt == "--auto-connect":
-                updates['auto_connect'] = arg.lower() in ('true', 'yes', '1')
-            elif opt == "--auto-reconnect":
-                updates['auto_reconnect'] = arg.lower() in ('true', 'yes', '1')
-            elif opt == "--nick":
-                updates['nicknames'] = [n.strip() for n in arg.split(',')]
-            elif opt == "--ident":
-                updates['ident'] = arg
-            elif opt == "--realname":
-                updates['realname'] = arg
-            elif opt == "--auth-user":
-                updates['auth_username'] = arg
-            elif opt == "--auth-pass":
-                updates['auth_password'] = arg
-            elif opt == "--auth-mech":
-                updates['auth_mechanism'] = int(arg)
-            elif opt == "--sasl-mech":
-                updates['sasl_mechanism'] = int(arg)
-            elif opt == "--oper":
-                updates['oper_auth'] = arg.lower() in ('true', 'yes', '1')
-            elif opt == "--oper-user":
-                updates['oper_username'] = arg
-            elif opt == "--oper-pass":
-                updates['oper_password'] = arg
-            elif opt == "--prefix":
-                updates['command_prefix'] = arg
-
+        updates, _ = OptionParser.parse(remaining_args, _MODIFY_OPTIONS)
     except GetoptError as e:
         bot.send_message(target, f"Error: invalid option: {e}", nickname)
         return
-    except ValueError:
-        bot.send_message(target, "Error: invalid value for numeric field", nickname)
+    except ValueError as e:
+        bot.send_message(target, f"Error: invalid value: {e}", nickname)
         return
 
     # Warn if network is connected
-    if network_id in network_manager.connectors:
+    if network_id in network_manager.connected_ids:
         bot.send_message(
             target,
             f"Warning: network {network_id} is currently connected. Changes will take effect after reconnect.",
@@ -536,8 +387,7 @@ def handle_modify(bot, target: str, nickname: str, args: List[str]):
     # Update database
     try:
         if bot.db.update_network(network_id, updates):
-            # Reload networks
-            network_manager.load_networks()
+            network_manager.apply_network_update(network_id, updates)
             bot.send_message(
                 target,
                 f"Success: modified network: {network_id}",
@@ -550,6 +400,21 @@ def handle_modify(bot, target: str, nickname: str, args: List[str]):
         bot.send_message(target, f"Error: failed to modify network: {e}", nickname)
 
 
+_HANDLERS = {
+    "list": handle_list,
+    "info": handle_info,
+    "connect": handle_connect,
+    "disconnect": handle_disconnect,
+    "reconnect": handle_reconnect,
+    "current": handle_current,
+    "add": handle_add,
+    "remove": handle_remove,
+    "modify": handle_modify,
+}
+
+_SUBCOMMAND_LIST = ", ".join(_HANDLERS)
+
+
 __all__ = [
     'PLUGIN_INFO',
     'command_network',
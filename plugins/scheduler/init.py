@@ -19,8 +19,12 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 from typing import List, Optional, Dict, Any
-from getopt import getopt, GetoptError
+from getopt import GetoptError
 from datetime import datetime
+from time import time
+from types import MappingProxyType
+
+from core import OptionParser, TaskState
 
 
 PLUGIN_INFO = {
@@ -32,62 +36,118 @@ PLUGIN_INFO = {
 
 PLUGIN_NAME = "scheduler"
 
+# Display name of each task state
+_STATE_NAMES = {state: state.name for state in TaskState}
+
+# Last (epoch second, "HH:MM:SS") pair handed out by _timestamp()
+_timestamp_cache = [0, ""]
+
+# Replies for the "task" subcommands
+_USAGE_TASK = "Usage: task SUBCOMMAND [OPTIONS]"
+_USAGE_INFO = "Usage: task info TASK_ID"
+_USAGE_START = "Usage: task start TASK_ID"
+_USAGE_STOP = "Usage: task stop TASK_ID"
+_USAGE_PAUSE = "Usage: task pause TASK_ID"
+_USAGE_RESUME = "Usage: task resume TASK_ID"
+_USAGE_REMOVE = "Usage: task remove TASK_ID"
+_UNKNOWN_SUBCOMMAND = "Unknown subcommand: %s"
+_TASK_NOT_FOUND = "Task not found: %s"
+_TASK_STARTED = "Task started: ID: %s, Name: %s"
+_TASK_STOPPED = "Task stopped: %s"
+_TASK_PAUSED = "Task paused: %s"
+_TASK_RESUMED = "Task resumed: %s"
+_TASK_REMOVED = "Task removed: %s"
+_FAIL_START = "Failed to start task: %s"
+_FAIL_STOP = "Failed to stop task: %s"
+_FAIL_PAUSE = "Failed to pause task: %s"
+_FAIL_RESUME = "Failed to resume task: %s"
+_FAIL_REMOVE = "Failed to remove task %s"
+_STOPPED_ALL = "Stopped all tasks"
+
+# OptionParser tables for the scheduler commands
+_LIST_OPTIONS = {
+    "-p": ("plugin", str),
+    "--plugin": ("plugin", str),
+    "-s": ("state", str),
+    "--state": ("state", str),
+}
 
-def format_task_info(task_info: Dict[str, Any]) -> str:
-    lines = [
-        f"Task: {task_info['name']} (ID: {task_info['id']})",
-        f"  State: {task_info['state']}",
-        f"  Type: {'Periodic' if task_info['periodic'] else 'One-time'}",
-    ]
-
-    if task_info['periodic']:
-        lines.append(f"  Interval: {task_info['interval']}s")
-
-    if task_info['delay']:
-        lines.append(f"  Initial Delay: {task_info['delay']}s")
-
-    lines.append(f"Run Count: {task_info['run_count']}")
-
-    if task_info['max_runs']:
-        lines.append(f"  Max Runs: {task_info['max_runs']}")
+_SCHEDULE_OPTIONS = {
+    "-i": ("interval", float),
+    "--interval": ("interval", float),
+    "-d": ("delay", float),
+    "--delay": ("delay", float),
+    "-m": ("max_runs", int),
+    "--max-runs": ("max_runs", int),
+    "-n": ("name", str),
+    "--name": ("name", str),
+    "--no-start": ("no_start", None),
+}
 
-    if task_info['last_run']:
-        lines.append(f"  Last Run: {task_info['last_run']}")
+_MODIFY_OPTIONS = {
+    "-i": ("interval", float),
+    "--interval": ("interval", float),
+    "-m": ("max_runs", int),
+    "--max-runs": ("max_runs", int),
+    "-D": ("description", str),
+    "--description": ("description", str),
+}
 
-    if task_info['plugin']:
-        lines.append(f"  Plugin: {task_info['plugin']}")
+# Interval in seconds for each "cron" preset
+_CRON_PRESETS = MappingProxyType({
+    "minutely": 60,
+    "hourly": 3600,
+    "daily": 86400
+})
+_CRON_PRESETS_AVAILABLE = ", ".join(_CRON_PRESETS)
 
-    if task_info['description']:
-        lines.append(f"  Description: {task_info['description']}")
 
-    return "\n".join(lines)
+def format_task_info(task_info: Dict[str, Any]) -> str:
+    # Optional lines are None when not applicable and skipped by filter()
+    return "\n".join(filter(None, (
+        f"Task: {task_info['name']} (ID: {task_info['id']})",
+        f"  State: {task_info['state']}",
+        f"  Type: {'Periodic' if task_info['periodic'] else 'One-time'}",
+        task_info['periodic'] and f"  Interval: {task_info['interval']}s",
+        task_info['delay'] and f"  Initial Delay: {task_info['delay']}s",
+        f"Run Count: {task_info['run_count']}",
+        task_info['max_runs'] and f"  Max Runs: {task_info['max_runs']}",
+        task_info['last_run'] and f"  Last Run: {task_info['last_run']}",
+        task_info['plugin'] and f"  Plugin: {task_info['plugin']}",
+        task_info['description'] and f"  Description: {task_info['description']}",
+    )))
 
 
-def format_task_list(tasks: List[Any]) -> str:
+def format_task_list(tasks: List[Any]) -> List[str]:
     if not tasks:
-        return "No tasks found"
+        return ["No tasks found"]
 
-    lines = []
+    return [
+        f"ID: {task.id}, Name: {task.name}, State: {_STATE_NAMES[task.state]}, "
+        f"Type: {'Periodic' if task.periodic else 'Once'}, Runs: {task.run_count}"
+        for task in tasks
+    ]
 
-    for task in tasks:
-        task_type = "Periodic" if task.periodic else "Once"
-        lines.append(
-            f"ID: {task.id}, Name: {task.name}, State: {task.state.name}, Type: {task_type}, Runs: {task.run_count}")
 
-    return "\n".join(lines)
+def _timestamp() -> str:
+    """Current HH:MM:SS, formatted at most once per second"""
+    now = int(time())
+    if _timestamp_cache[0] != now:
+        _timestamp_cache[0] = now
+        _timestamp_cache[1] = datetime.fromtimestamp(now).strftime("%H:%M:%S")
+    return _timestamp_cache[1]
 
 
 def periodic_message_callback(bot, target: str, message: str):
     """Callback for periodic message task"""
-    timestamp = datetime.now().strftime("%H:%M:%S")
-    bot.send_message(target, f"[{timestamp}] {message}")
+    bot.send_message(target, f"[{_timestamp()}] {message}")
 
 
-def countdown_callback(bot, target: str, task_id: str, count: List[int]):
-    """Callback for countdown task"""
-    if count[0] > 0:
-        bot.send_message(target, f"Countdown: {count[0]}")
-        count[0] -= 1
+def _countdown_tick(bot, target: str, task_id: str, remaining: List[int]):
+    """Callback for countdown task, counting down remaining[0]"""
+    if remaining[0] > 0:
+        bot.send_message(target, f"Countdown: {remaining[0]}")
+        remaining[0] -= 1
     else:
         bot.send_message(target, "Countdown complete!")
         bot.scheduler.stop_task(task_id)
@@ -102,7 +162,7 @@ def heartbeat_callback(bot, target: str):
     """Simple heartbeat callback for testing"""
     bot.send_message(
         target,
-        f"♥ Heartbeat at {datetime.now().strftime('%H:%M:%S')}")
+        f"♥ Heartbeat at {_timestamp()}")
 
 
 def command_task(bot, target: str, nickname: str, args: List[str]):
@@ -129,136 +189,129 @@ def command_task(bot, target: str, nickname: str, args: List[str]):
         task stop abc123
     """
     if not args:
-        bot.send_message(target, "Usage: task SUBCOMMAND [OPTIONS]", nickname)
+        bot.send_message(target, _USAGE_TASK, nickname)
         return
 
     subcommand = args[0].lower()
     subargs = args[1:]
 
-    scheduler = bot.scheduler
+    handler = _TASK_HANDLERS.get(subcommand)
+
+    if handler:
+        handler(bot, bot.scheduler, target, nickname, subargs)
+    else:
+        bot.send_message(target, _UNKNOWN_SUBCOMMAND % subcommand, nickname)
 
-    if subcommand == "list":
-        # Parse filter options
-        plugin_filter = None
-        state_filter = None
 
+def handle_list(bot, scheduler, target: str, nickname: str, args: List[str]):
+    # Parse filter options
+    try:
+        parsed, _ = OptionParser.parse(args, _LIST_OPTIONS)
+    except GetoptError as e:
+        bot.send_message(target, f"Invalid option: {e}", nickname)
+        return
+
+    plugin_filter = parsed.get("plugin")
+    state_filter = None
+
+    if "state" in parsed:
         try:
-            opts, _ = getopt(subargs, "p:s:", ["plugin=", "state="])
-            for opt, arg in opts:
-                if opt in ("-p", "--plugin"):
-                    plugin_filter = arg
-                elif opt in ("-s", "--state"):
-                    from dunamis import TaskState
-                    try:
-                        state_filter = TaskState[arg.upper()]
-                    except KeyError:
-                        bot.send_message(
-                            target, f"Invalid state: {arg}", nickname)
-                        return
-        except GetoptError as e:
-            bot.send_message(target, f"Invalid option: {e}", nickname)
+            state_filter = TaskState[parsed["state"].upper()]
+        except KeyError:
+            bot.send_message(
+                target, f"Invalid state: {parsed['state']}", nickname)
             return
 
+    if plugin_filter is None and state_filter is None:
+        tasks = scheduler.list_tasks()
+    else:
         tasks = scheduler.list_tasks(
             plugin_name=plugin_filter,
             state=state_filter)
-        output = format_task_list(tasks)
+    lines = format_task_list(tasks)
+    bot.send_messagev(target, lines, nickname)
+
+
+def handle_info(bot, scheduler, target: str, nickname: str, args: List[str]):
+    if not args:
+        bot.send_message(target, _USAGE_INFO, nickname)
+        return
+
+    task_id = args[0]
+    task_info = scheduler.get_task_info(task_id)
+
+    if task_info:
+        output = format_task_info(task_info)
         bot.send_message(target, output, nickname)
+    else:
+        bot.send_message(target, _TASK_NOT_FOUND % task_id, nickname)
 
-    elif subcommand == "info":
-        if not subargs:
-            bot.send_message(target, "Usage: task info TASK_ID", nickname)
-            return
 
-        task_id = subargs[0]
-        task_info = scheduler.get_task_info(task_id)
+def handle_start(bot, scheduler, target: str, nickname: str, args: List[str]):
+    if not args:
+        bot.send_message(target, _USAGE_START, nickname)
+        return
 
-        if task_info:
-            output = format_task_info(task_info)
-            bot.send_message(target, output, nickname)
-        else:
-            bot.send_message(target, f"Task not found: {task_id}", nickname)
+    task_id = args[0]
+    if scheduler.start_task(task_id):
+        task = scheduler.get_task(task_id)
+        bot.send_message(
+            target, _TASK_STARTED % (task_id, task.name), nickname)
+    else:
+        bot.send_message(target, _FAIL_START % task_id, nickname)
 
-    elif subcommand == "start":
-        if not subargs:
-            bot.send_message(target, "Usage: task start TASK_ID", nickname)
-            return
 
-        task_id = subargs[0]
-        if scheduler.start_task(task_id):
-            task = scheduler.get_task(task_id)
-            bot.send_message(
-                target,
-                f"Task started: ID: {task_id}, Name: {task.name}",
-                nickname)
-        else:
-            bot.send_message(
-                target,
-                f"Failed to start task: {task_id}",
-                nickname)
+def handle_stop(bot, scheduler, target: str, nickname: str, args: List[str]):
+    if not args:
+        bot.send_message(target, _USAGE_STOP, nickname)
+        return
 
-    elif subcommand == "stop":
-        if not subargs:
-            bot.send_message(target, "Usage: task stop TASK_ID", nickname)
-            return
+    task_id = args[0]
+    if scheduler.stop_task(task_id):
+        bot.send_message(target, _TASK_STOPPED % task_id, nickname)
+    else:
+        bot.send_message(target, _FAIL_STOP % task_id, nickname)
 
-        task_id = subargs[0]
-        if scheduler.stop_task(task_id):
-            bot.send_message(target, f"Task stopped: {task_id}", nickname)
-        else:
-            bot.send_message(
-                target,
-                f"Failed to stop task: {task_id}",
-                nickname)
 
-    elif subcommand == "pause":
-        if not subargs:
-            bot.send_message(target, "Usage: task pause TASK_ID", nickname)
-            return
+def handle_pause(bot, scheduler, target: str, nickname: str, args: List[str]):
+    if not args:
+        bot.send_message(target, _USAGE_PAUSE, nickname)
+        return
 
-        task_id = subargs[0]
-        if scheduler.pause_task(task_id):
-            bot.send_message(target, f"Task paused: {task_id}", nickname)
-        else:
-            bot.send_message(
-                target,
-                f"Failed to pause task: {task_id}",
-                nickname)
+    task_id = args[0]
+    if scheduler.pause_task(task_id):
+        bot.send_message(target, _TASK_PAUSED % task_id, nickname)
+    else:
+        bot.send_message(target, _FAIL_PAUSE % task_id, nickname)
 
-    elif subcommand == "resume":
-        if not subargs:
-            bot.send_message(target, "Usage: task resume TASK_ID", nickname)
-            return
 
-        task_id = subargs[0]
-        if scheduler.resume_task(task_id):
-            bot.send_message(target, f"Task resumed: {task_id}", nickname)
-        else:
-            bot.send_message(
-                target,
-                f"Failed to resume task: {task_id}",
-                nickname)
+def handle_resume(bot, scheduler, target: str, nickname: str, args: List[str]):
+    if not args:
+        bot.send_message(target, _USAGE_RESUME, nickname)
+        return
 
-    elif subcommand == "remove":
-        if not subargs:
-            bot.send_message(target, "Usage: task remove TASK_ID", nickname)
-            return
+    task_id = args[0]
+    if scheduler.resume_task(task_id):
+        bot.send_message(target, _TASK_RESUMED % task_id, nickname)
+    else:
+        bot.send_message(target, _FAIL_RESUME % task_id, nickname)
 
-        task_id = subargs[0]
-        if scheduler.remove_task(task_id):
-            bot.send_message(target, f"Task removed: {task_id}", nickname)
-        else:
-            bot.send_message(
-                target,
-                f"Failed to remove task {task_id}",
-                nickname)
 
-    elif subcommand == "stopall":
-        scheduler.stop_all_tasks()
-        bot.send_message(target, "Stopped all tasks", nickname)
+def handle_remove(bot, scheduler, target: str, nickname: str, args: List[str]):
+    if not args:
+        bot.send_message(target, _USAGE_REMOVE, nickname)
+        return
 
+    task_id = args[0]
+    if scheduler.remove_task(task_id):
+        bot.send_message(target, _TASK_REMOVED % task_id, nickname)
     else:
-        bot.send_message(target, f"Unknown subcommand: {subcommand}", nickname)
+        bot.send_message(target, _FAIL_REMOVE % task_id, nickname)
+
+
+def handle_stopall(bot, scheduler, target: str, nickname: str, args: List[str]):
+    scheduler.stop_all_tasks()
+    bot.send_message(target, _STOPPED_ALL, nickname)
 
 
 def command_schedule(bot, target: str, nickname: str, args: List[str]):
@@ -299,30 +352,8 @@ def command_schedule(bot, target: str, nickname: str, args: List[str]):
     remaining_args = args[1:]
 
     # Parse options
-    interval = 60.0
-    delay = 0.0
-    max_runs = None
-    custom_name = None
-    auto_start = True
-
     try:
-        opts, task_args = getopt(
-            remaining_args,
-            "i:d:m:n:",
-            ["interval=", "delay=", "max-runs=", "name=", "no-start"]
-        )
-
-        for opt, arg in opts:
-            if opt in ("-i", "--interval"):
-                interval = float(arg)
-            elif opt in ("-d", "--delay"):
-                delay = float(arg)
-            elif opt in ("-m", "--max-runs"):
-                max_runs = int(arg)
-            elif opt in ("-n", "--name"):
-                custom_name = arg
-            elif opt == "--no-start":
-                auto_start = False
+        parsed, task_args = OptionParser.parse(remaining_args, _SCHEDULE_OPTIONS)
     except GetoptError as e:
         bot.send_message(target, f"Invalid option: {e}", nickname)
         return
@@ -330,116 +361,142 @@ def command_schedule(bot, target: str, nickname: str, args: List[str]):
         bot.send_message(target, f"Invalid value: {e}", nickname)
         return
 
-    scheduler = bot.scheduler
-    task_id = None
+    handler = _SCHEDULE_HANDLERS.get(task_type)
 
-    if task_type == "message":
-        if not task_args:
-            bot.send_message(target, "Provide a message to send", nickname)
-            return
+    if handler is None:
+        bot.send_message(target, f"Unknown task type: {task_type}", nickname)
+        return
 
-        message = " ".join(task_args)
-        name = custom_name or f"periodic-msg-{target}"
-
-        task_id = scheduler.add_task(
-            name=name,
-            callback=periodic_message_callback,
-            interval=interval,
-            args=(bot, target, message),
-            periodic=True,
-            delay=delay,
-            max_runs=max_runs,
-            plugin_name=PLUGIN_NAME,
-            description=f"Periodic message: {message[:30]}...",
-            auto_start=auto_start
-        )
+    options = {
+        "interval": parsed.get("interval", 60.0),
+        "delay": parsed.get("delay", 0.0),
+        "max_runs": parsed.get("max_runs"),
+        "name": parsed.get("name"),
+        "auto_start": not parsed.get("no_start", False),
+    }
 
-    elif task_type == "reminder":
-        if not task_args:
-            bot.send_message(target, "Provide a reminder message", nickname)
-            return
+    handler(bot, bot.scheduler, target, nickname, task_args, options)
 
-        message = " ".join(task_args)
-        name = custom_name or f"reminder-{nickname}"
-
-        # For reminders, use delay as the trigger time
-        if delay == 0.0:
-            delay = interval  # Default to interval if no delay specified
-
-        task_id = scheduler.add_task(
-            name=name,
-            callback=reminder_callback,
-            interval=delay,
-            args=(bot, target, nickname, message),
-            periodic=False,
-            delay=delay,
-            plugin_name=PLUGIN_NAME,
-            description=f"Reminder: {message[:30]}...",
-            auto_start=auto_start
-        )
 
-    elif task_type == "heartbeat":
-        name = custom_name or f"heartbeat-{target}"
-
-        task_id = scheduler.add_task(
-            name=name,
-            callback=heartbeat_callback,
-            interval=interval,
-            args=(bot, target),
-            periodic=True,
-            delay=delay,
-            max_runs=max_runs,
-            plugin_name=PLUGIN_NAME,
-            description="Periodic heartbeat for testing",
-            auto_start=auto_start
-        )
+def _report_created(bot, target: str, nickname: str,
+                    task_id: Optional[str], auto_start: bool):
+    if task_id:
+        status = "started" if auto_start else "created (not started)"
+        bot.send_message(target, f"Task {status}: {task_id}", nickname)
+    else:
+        bot.send_message(target, "Failed to create task", nickname)
 
-    elif task_type == "countdown":
-        if not task_args:
-            bot.send_message(target, "Provide a countdown number", nickname)
-            return
 
-        try:
-            count_from = int(task_args[0])
-        except ValueError:
-            bot.send_message(target, "Invalid countdown number", nickname)
-            return
+def schedule_message(bot, scheduler, target: str, nickname: str,
+                     args: List[str], options: Dict[str, Any]):
+    if not args:
+        bot.send_message(target, "Provide a message to send", nickname)
+        return
 
-        name = custom_name or f"countdown-{count_from}"
-        count_holder = [count_from]  # Mutable to track countdown
-
-        # First create the task to get its ID
-        task_id = scheduler.add_task(
-            name=name,
-            callback=lambda: None,  # Placeholder
-            interval=1.0,
-            periodic=True,
-            delay=delay,
-            max_runs=count_from + 1,
-            plugin_name=PLUGIN_NAME,
-            description=f"Countdown from {count_from}",
-            auto_start=False
-        )
+    message = args[0] if len(args) == 1 else " ".join(args)
+    name = options["name"] or f"periodic-msg-{target}"
+
+    task_id = scheduler.add_task(
+        name=name,
+        callback=periodic_message_callback,
+        interval=options["interval"],
+        args=(bot, target, message),
+        periodic=True,
+        delay=options["delay"],
+        max_runs=options["max_runs"],
+        plugin_name=PLUGIN_NAME,
+        description=f"Periodic message: {message[:30]}...",
+        auto_start=options["auto_start"]
+    )
 
-        if task_id:
-            # Update the callback with the actual task ID
-            task = scheduler.get_task(task_id)
-            task.callback = lambda: countdown_callback(
-                bot, target, task_id, count_holder)
-            task.args = ()
+    _report_created(bot, target, nickname, task_id, options["auto_start"])
 
-            if auto_start:
-                scheduler.start_task(task_id)
 
-    else:
-        bot.send_message(target, f"Unknown task type: {task_type}", nickname)
+def schedule_reminder(bot, scheduler, target: str, nickname: str,
+                      args: List[str], options: Dict[str, Any]):
+    if not args:
+        bot.send_message(target, "Provide a reminder message", nickname)
+        return
+
+    message = args[0] if len(args) == 1 else " ".join(args)
+    name = options["name"] or f"reminder-{nickname}"
+
+    # For reminders, use delay as the trigger time
+    delay = options["delay"]
+    if delay == 0.0:
+        delay = options["interval"]  # Default to interval if no delay specified
+
+    task_id = scheduler.add_task(
+        name=name,
+        callback=reminder_callback,
+        interval=delay,
+        args=(bot, target, nickname, message),
+        periodic=False,
+        delay=delay,
+        plugin_name=PLUGIN_NAME,
+        description=f"Reminder: {message[:30]}...",
+        auto_start=options["auto_start"]
+    )
+
+    _report_created(bot, target, nickname, task_id, options["auto_start"])
+
+
+def schedule_heartbeat(bot, scheduler, target: str, nickname: str,
+                       args: List[str], options: Dict[str, Any]):
+    name = options["name"] or f"heartbeat-{target}"
+
+    task_id = scheduler.add_task(
+        name=name,
+        callback=heartbeat_callback,
+        interval=options["interval"],
+        args=(bot, target),
+        periodic=True,
+        delay=options["delay"],
+        max_runs=options["max_runs"],
+        plugin_name=PLUGIN_NAME,
+        description="Periodic heartbeat for testing",
+        auto_start=options["auto_start"]
+    )
+
+    _report_created(bot, target, nickname, task_id, options["auto_start"])
+
+
+def schedule_countdown(bot, scheduler, target: str, nickname: str,
+                       args: List[str], options: Dict[str, Any]):
+    if not args:
+        bot.send_message(target, "Provide a countdown number", nickname)
         return
 
+    try:
+        count_from = int(args[0])
+    except ValueError:
+        bot.send_message(target, "Invalid countdown number", nickname)
+        return
+
+    name = options["name"] or f"countdown-{count_from}"
+
+    # Create the task stopped; its args need the generated task ID
+    task_id = scheduler.add_task(
+        name=name,
+        callback=_countdown_tick,
+        interval=1.0,
+        periodic=True,
+        delay=options["delay"],
+        max_runs=count_from + 1,
+        plugin_name=PLUGIN_NAME,
+        description=f"Countdown from {count_from}",
+        auto_start=False
+    )
+
     if task_id:
-        status = "started" if auto_start else "created (not started)"
-        bot.send_message(target, f"Task {status}: {task_id}", nickname)
-    else:
-        bot.send_message(target, "Failed to create task", nickname)
+        # The counter lives in the callback's args, not on the task
+        task = scheduler.get_task(task_id)
+        task.args = (bot, target, task_id, [count_from])
+
+        if options["auto_start"]:
+            scheduler.start_task(task_id)
+
+    _report_created(bot, target, nickname, task_id, options["auto_start"])
 
 
 def command_modify(bot, target: str, nickname: str, args: List[str]):
@@ -466,24 +523,8 @@ def command_modify(bot, target: str, nickname: str, args: List[str]):
     remaining = args[1:]
 
     # Parse options
-    new_interval = None
-    new_max_runs = None
-    new_description = None
-
     try:
-        opts, _ = getopt(
-            remaining,
-            "i:m:D:",
-            ["interval=", "max-runs=", "description="]
-        )
-
-        for opt, arg in opts:
-            if opt in ("-i", "--interval"):
-                new_interval = float(arg)
-            elif opt in ("-m", "--max-runs"):
-                new_max_runs = int(arg) if int(arg) > 0 else None
-            elif opt in ("-D", "--description"):
-                new_description = arg
+        parsed, _ = OptionParser.parse(remaining, _MODIFY_OPTIONS)
     except GetoptError as e:
         bot.send_message(target, f"Invalid option: {e}", nickname)
         return
@@ -491,6 +532,13 @@ def command_modify(bot, target: str, nickname: str, args: List[str]):
         bot.send_message(target, f"Invalid value: {e}", nickname)
         return
 
+    new_interval = parsed.get("interval")
+    new_max_runs = parsed.get("max_runs")
+    new_description = parsed.get("description")
+
+    if new_max_runs is not None and new_max_runs <= 0:
+        new_max_runs = None
+
     if new_interval is None and new_max_runs is None and new_description is None:
         bot.send_message(target, "No modifications specified", nickname)
         return
@@ -524,12 +572,6 @@ def command_cron(bot, target: str, nickname: str, args: List[str]):
         cron minutely "System check"
         cron hourly -n "status" "Hourly status update"
     """
-    presets = {
-        "minutely": 60,
-        "hourly": 3600,
-        "daily": 86400
-    }
-
     if not args:
         bot.send_message(
             target,
@@ -540,31 +582,41 @@ def command_cron(bot, target: str, nickname: str, args: List[str]):
     preset = args[0].lower()
     remaining = args[1:]
 
-    if preset not in presets:
-        available = ", ".join(presets.keys())
+    interval = _CRON_PRESETS.get(preset)
+    if interval is None:
         bot.send_message(
             target,
-            f"Unknown preset. Available: {available}",
+            f"Unknown preset. Available: {_CRON_PRESETS_AVAILABLE}",
             nickname)
         return
 
-    interval = presets[preset]
+    # -n/--name is the only cron option, so it is matched by hand
     custom_name = None
+    message_parts = remaining
+    first = remaining[0] if remaining else ""
 
-    try:
-        opts, message_parts = getopt(remaining, "n:", ["name="])
-        for opt, arg in opts:
-            if opt in ("-n", "--name"):
-                custom_name = arg
-    except GetoptError as e:
-        bot.send_message(target, f"Invalid option: {e}", nickname)
-        return
+    if first == "-n" or first == "--name":
+        if len(remaining) < 2:
+            bot.send_message(
+                target,
+                f"Invalid option: option {first} requires argument",
+                nickname)
+            return
+        custom_name = remaining[1]
+        message_parts = remaining[2:]
+    elif first.startswith("--name="):
+        custom_name = first[7:]
+        message_parts = remaining[1:]
+    elif first.startswith("-n"):
+        custom_name = first[2:]
+        message_parts = remaining[1:]
 
     if not message_parts:
         bot.send_message(target, "Provide a message", nickname)
         return
 
-    message = " ".join(message_parts)
+    message = (message_parts[0] if len(message_parts) == 1
+               else " ".join(message_parts))
     name = custom_name or f"{preset}-{target}"
 
     task_id = bot.scheduler.add_task(
@@ -588,6 +640,25 @@ def command_cron(bot, target: str, nickname: str, args: List[str]):
         bot.send_message(target, "Failed to create task", nickname)
 
 
+_TASK_HANDLERS = {
+    "list": handle_list,
+    "info": handle_info,
+    "start": handle_start,
+    "stop": handle_stop,
+    "pause": handle_pause,
+    "resume": handle_resume,
+    "remove": handle_remove,
+    "stopall": handle_stopall,
+}
+
+_SCHEDULE_HANDLERS = {
+    "message": schedule_message,
+    "reminder": schedule_reminder,
+    "heartbeat": schedule_heartbeat,
+    "countdown": schedule_countdown,
+}
+
+
 __all__ = [
     'PLUGIN_INFO',
     'command_task',
@@ -27,10 +27,10 @@ PLUGIN_INFO = {
     "description": "Test Plugin for Dunamis"
 }
 
+TEST_VALUE = "test"
+
 def value_test(bot) -> str:
-    return "test"
+    return TEST_VALUE
 
 def command_test(bot, target: str, nickname: str, args: List[str]):
-    message = "test"
-    bot.send_message(target, message, nickname)
-    print(dir(bot))
+    bot.send_message(target, TEST_VALUE, nickname)
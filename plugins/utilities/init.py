@@ -19,9 +19,13 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 from typing import List, Tuple, Optional
-from platform import system, node, release, version, machine
-from getopt import getopt, GetoptError
+from platform import uname
+from getopt import GetoptError
 from dataclasses import dataclass
+from datetime import datetime
+from pytz import timezone as pytz_timezone
+
+from core import OptionParser
 
 
 PLUGIN_INFO = {
@@ -31,6 +35,55 @@ PLUGIN_INFO = {
     "description": "Core utility commands for Dunamis bot"
 }
 
+# Host identity for "uname", read once since it does not change at runtime
+_SYSTEM, _NODE, _RELEASE, _VERSION, _MACHINE = uname()[:5]
+_OS_NAME = "GNU/Linux"
+_UNAME_ALL = f"{_SYSTEM} {_NODE} {_RELEASE} {_VERSION} {_MACHINE} {_OS_NAME}"
+
+# "uname" option bits and the field each bit selects, in output order
+_UNAME_FLAGS = {
+    "-s": 0x01, "--kernel-name": 0x01,
+    "-n": 0x02, "--nodename": 0x02,
+    "-r": 0x04, "--kernel-release": 0x04,
+    "-v": 0x08, "--kernel-version": 0x08,
+    "-m": 0x10, "--machine": 0x10,
+    "-o": 0x20, "--operating-system": 0x20,
+    "-a": 0x3F, "--all": 0x3F,
+}
+_UNAME_SHORT_FLAGS = {
+    flag[1]: bit for flag, bit in _UNAME_FLAGS.items()
+    if not flag.startswith("--")}
+_UNAME_PARTS = (
+    (_SYSTEM, 0x01),
+    (_NODE, 0x02),
+    (_RELEASE, 0x04),
+    (_VERSION, 0x08),
+    (_MACHINE, 0x10),
+    (_OS_NAME, 0x20),
+)
+
+# strftime formats shared by "date" and the date/time values
+_DATE_FORMAT = "%Y-%m-%d"
+_TIME_FORMAT = "%H:%M:%S"
+_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# OptionParser table for "date"
+_DATE_OPTIONS = {
+    "-f": ("format", str),
+    "--format": ("format", str),
+    "-p": ("preset", str),
+    "--preset": ("preset", str),
+    "-t": ("timezone", str),
+    "--timezone": ("timezone", str),
+}
+
+# "date --preset" names; anything else falls back to _DATETIME_FORMAT
+_DATE_PRESETS = {
+    "date": _DATE_FORMAT,
+    "time": _TIME_FORMAT,
+    "datetime": _DATETIME_FORMAT,
+}
+
 
 @dataclass
 class CommandContext:
@@ -45,31 +98,39 @@ class MessageFormatter:
         if not rows:
             return ""
 
-        # Split into chunks
-        chunks = [rows[i::columns] for i in range(columns)]
+        # Stringify every cell once
+        cells = [str(item) for item in rows]
+
+        # A single row needs no padding, each cell is its column's width
+        if len(cells) <= columns:
+            return "  ".join(cells)
 
         # Find max width for each column
-        col_widths = [max(len(str(item)) for item in col) for col in chunks]
+        col_widths = [
+            max(map(len, cells[i::columns]), default=0)
+            for i in range(columns)]
 
-        # Build grid
-        lines = []
-        max_rows = max(len(col) for col in chunks)
+        # One padded field per column, shared by every full row
+        fields = ["{:<%d}" % width for width in col_widths]
+        line_format = "  ".join(fields)
 
-        for row_idx in range(max_rows):
-            row_parts = []
-            for col_idx, col in enumerate(chunks):
-                if row_idx < len(col):
-                    item = str(col[row_idx]).ljust(col_widths[col_idx])
-                    row_parts.append(item)
-            lines.append("  ".join(row_parts))
+        # Build grid, one row of `columns` cells per line
+        full = len(cells) - len(cells) % columns
+        lines = [
+            line_format.format(*cells[start:start + columns])
+            for start in range(0, full, columns)]
+
+        # A short last row only fills its leading columns
+        if full < len(cells):
+            tail = cells[full:]
+            lines.append("  ".join(fields[:len(tail)]).format(*tail))
 
         return "\n".join(lines)
 
     @staticmethod
-    def escape_sequences(text: str) -> str:
-        # Replace tab with spaces
-        text = text.replace("\\t", "    ")
-        return text
+    def escape_lines(text: str) -> List[str]:
+        # Expand \t to spaces, then split into lines on \n
+        return text.replace("\\t", "    ").split("\\n")
 
 
 def value_self_nick(bot) -> str:
@@ -85,46 +146,41 @@ def value_self_name(bot) -> str:
 
 
 def value_date(bot) -> str:
-    from datetime import datetime
-    return datetime.now().strftime("%Y-%m-%d")
+    return datetime.now().strftime(_DATE_FORMAT)
 
 
 def value_time(bot) -> str:
-    from datetime import datetime
-    return datetime.now().strftime("%H:%M:%S")
+    return datetime.now().strftime(_TIME_FORMAT)
 
 
 def value_network(bot) -> str:
-    print(dir(bot))
-    return
+    return bot.factory.config.name
+
+
+# Reply to "help"; the bot's current nickname is filled in
+_HELP_TEXT = (
+    "Hello there, I am a Dunamis bot called %s. "
+    "For a list of commands, send '!commands' "
+    "into a channel or 'commands' to me as a PM.\n"
+    "For more information: https://github.com/helenah2025/Dunamis/wiki/User-Guide\n"
+    "NOTICE: This project has been totally refactored, the wiki page above does not yet exist.")
 
 
 def command_help(bot, target: str, nickname: str, args: List[str]):
-    help_text = (
-        f"Hello there, I am a Dunamis bot called {bot.nickname}. "
-        f"For a list of commands, send '!commands' "
-        f"into a channel or 'commands' to me as a PM.\n"
-        f"For more information: https://github.com/helenah2025/Dunamis/wiki/User-Guide\n"
-        f"NOTICE: This project has been totally refactored, the wiki page above does not yet exist.")
-    bot.send_message(target, help_text, nickname)
+    bot.send_message(target, _HELP_TEXT % bot.nickname, nickname)
 
 
 def command_commands(bot, target: str, nickname: str, args: List[str]):
     # Get all registered commands
-    commands = sorted(bot.plugin_manager.commands.keys())
+    registered = bot.plugin_manager.commands
+    commands = bot.plugin_manager.sorted_commands
 
     if not commands:
         bot.send_message(target, "No commands available", nickname)
         return
 
-    # Count unique plugins
-    plugins = set()
-    for cmd_name in commands:
-        cmd_func = bot.plugin_manager.commands[cmd_name]
-        plugins.add(cmd_func.__module__)
-
     command_count = len(commands)
-    plugin_count = len(plugins)
+    plugin_count = len({func.__module__ for func in registered.values()})
 
     # Build description
     if command_count == 1:
@@ -145,26 +201,15 @@ def command_commands(bot, target: str, nickname: str, args: List[str]):
 
 
 def command_date(bot, target: str, nickname: str, args: List[str]):
-    from datetime import datetime
-    from pytz import timezone as pytz_timezone
-
-    timezone_arg = None
-    format_arg = None
-    preset_arg = None
-
     try:
-        opts, _ = getopt(args, "f:p:t:", ["format=", "preset=", "timezone="])
+        parsed, _ = OptionParser.parse(args, _DATE_OPTIONS)
     except GetoptError as e:
         bot.send_message(target, f"Invalid option: {e}", nickname)
         return
 
-    for opt, arg in opts:
-        if opt in ("-t", "--timezone"):
-            timezone_arg = arg
-        elif opt in ("-f", "--format"):
-            format_arg = arg
-        elif opt in ("-p", "--preset"):
-            preset_arg = arg
+    timezone_arg = parsed.get("timezone")
+    format_arg = parsed.get("format")
+    preset_arg = parsed.get("preset")
 
     # Get current time
     try:
@@ -177,79 +222,50 @@ def command_date(bot, target: str, nickname: str, args: List[str]):
         return
 
     # Format output
-    if format_arg:
-        result = now.strftime(format_arg)
-    elif preset_arg == "date":
-        result = now.strftime("%Y-%m-%d")
-    elif preset_arg == "time":
-        result = now.strftime("%H:%M:%S")
-    elif preset_arg == "datetime":
-        result = now.strftime("%Y-%m-%d %H:%M:%S")
-    else:
-        result = now.strftime("%Y-%m-%d %H:%M:%S")
+    date_format = format_arg or _DATE_PRESETS.get(preset_arg, _DATETIME_FORMAT)
+    bot.send_message(target, now.strftime(date_format), nickname)
 
-    bot.send_message(target, result, nickname)
+
+def _uname_mask(args: List[str]) -> int:
+    # Options stop at the first non-option argument, as with getopt
+    mask = 0
+
+    for arg in args:
+        if arg == "--":
+            break
+        if not arg.startswith("-") or arg == "-":
+            break
+
+        if arg.startswith("--"):
+            bit = _UNAME_FLAGS.get(arg)
+            if bit is None:
+                raise GetoptError(f"option {arg} not recognized", arg)
+            mask |= bit
+        else:
+            for ch in arg[1:]:
+                bit = _UNAME_SHORT_FLAGS.get(ch)
+                if bit is None:
+                    raise GetoptError(f"option -{ch} not recognized", ch)
+                mask |= bit
+
+    return mask
 
 
 def command_uname(bot, target: str, nickname: str, args: List[str]):
     # Imitation of the uname system command
-    os_name = "GNU/Linux"
-
     try:
-        opts, _ = getopt(
-            args,
-            "snrvmoa",
-            ["kernel-name", "nodename", "kernel-release",
-             "kernel-version", "machine", "operating-system", "all"]
-        )
+        mask = _uname_mask(args)
     except GetoptError as e:
         bot.send_message(target, f"Invalid option: {e}", nickname)
         return
 
     # If no options, print everything
-    if not opts:
-        result = f"{system()} {node()} {release()} {version()} {machine()} {os_name}"
-        bot.send_message(target, result, nickname)
+    if not mask:
+        bot.send_message(target, _UNAME_ALL, nickname)
         return
 
     # Build output based on options
-    parts = []
-    flags = {
-        "system": False,
-        "node": False,
-        "release": False,
-        "version": False,
-        "machine": False,
-        "os": False
-    }
-
-    for opt, _ in opts:
-        if opt in ("-s", "--kernel-name", "-a", "--all"):
-            flags["system"] = True
-        if opt in ("-n", "--nodename", "-a", "--all"):
-            flags["node"] = True
-        if opt in ("-r", "--kernel-release", "-a", "--all"):
-            flags["release"] = True
-        if opt in ("-v", "--kernel-version", "-a", "--all"):
-            flags["version"] = True
-        if opt in ("-m", "--machine", "-a", "--all"):
-            flags["machine"] = True
-        if opt in ("-o", "--operating-system", "-a", "--all"):
-            flags["os"] = True
-
-    if flags["system"]:
-        parts.append(system())
-    if flags["node"]:
-        parts.append(node())
-    if flags["release"]:
-        parts.append(release())
-    if flags["version"]:
-        parts.append(version())
-    if flags["machine"]:
-        parts.append(machine())
-    if flags["os"]:
-        parts.append(os_name)
-
+    parts = [part for part, bit in _UNAME_PARTS if mask & bit]
     bot.send_message(target, " ".join(parts), nickname)
 
 
@@ -257,17 +273,22 @@ def command_echo(bot, target: str, nickname: str, args: List[str]):
     enable_escapes = False
     suppress_newline = False
 
-    try:
-        opts, remaining_args = getopt(args, "en")
-    except GetoptError as e:
-        bot.send_message(target, f"Invalid option: {e}", nickname)
-        return
-
-    for opt, _ in opts:
-        if opt == "-e":
+    # Leading -e/-n flags, alone or combined; anything else starts the text
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == "--":
+            i += 1
+            break
+        if len(arg) < 2 or arg[0] != "-" or arg[1:].strip("en"):
+            break
+        if "e" in arg:
             enable_escapes = True
-        elif opt == "-n":
+        if "n" in arg:
             suppress_newline = True
+        i += 1
+
+    remaining_args = args[i:]
 
     # Join remaining arguments
     if not remaining_args:
@@ -280,10 +301,12 @@ def command_echo(bot, target: str, nickname: str, args: List[str]):
 
     # Process escape sequences if enabled
     if enable_escapes:
-        message = MessageFormatter.escape_sequences(message)
-        # Split on actual newlines for multi-line output
-        for line in message.split("\\n"):
-            bot.send_message(target, line, nickname)
+        # One message per \n-separated line, each addressed to the caller,
+        # written in a single batch
+        lines = MessageFormatter.escape_lines(message)
+        if nickname:
+            lines = [f"{nickname}: {line}" for line in lines]
+        bot.send_messagev(target, lines)
     else:
         bot.send_message(target, message, nickname)
 
@@ -299,30 +322,19 @@ def command_nick(bot, target: str, nickname: str, args: List[str]):
 
 
 def command_plugin(bot, target: str, nickname: str, args: List[str]):
-    handlers = {
-        "help": handle_plugin_help,
-        "list": handle_plugin_list,
-        "load": handle_plugin_load,
-        "unload": handle_plugin_unload,
-        "enable": handle_plugin_enable,
-        "disable": handle_plugin_disable,
-    }
-
-    subcommand_list = ", ".join(handlers.keys())
-
     if not args:
-        bot.send_message(target, f"Usage: requires a subcommand: {subcommand_list}", nickname)
+        bot.send_message(target, f"Usage: requires a subcommand: {_PLUGIN_SUBCOMMAND_LIST}", nickname)
         return
 
     subcommand = args[0].lower()
     subargs = args[1:]
 
-    handler = handlers.get(subcommand)
+    handler = _PLUGIN_HANDLERS.get(subcommand)
 
     if handler:
         handler(bot, target, nickname, subargs)
     else:
-        bot.send_message(target, f"Error: unknown subcommand: {subcommand} - available subcommands: {subcommand_list}", nickname)
+        bot.send_message(target, f"Error: unknown subcommand: {subcommand} - available subcommands: {_PLUGIN_SUBCOMMAND_LIST}", nickname)
 
 def handle_plugin_help(bot, target: str, nickname: str, args: List[str]):
     help_text = (
@@ -348,8 +360,9 @@ def handle_plugin_load(bot, target: str, nickname: str, args: List[str]):
         bot.send_message(target, "Specify plugin(s) to load", nickname)
         return
 
+    plugin_manager = bot.plugin_manager
     for plugin_name in args:
-        if bot.plugin_manager.load_plugin(plugin_name):
+        if plugin_manager.load_plugin(plugin_name):
             bot.send_message(
                 target, f"Success: loaded plugin: {plugin_name}", nickname)
         else:
@@ -361,8 +374,9 @@ def handle_plugin_unload(bot, target: str, nickname: str, args: List[str]):
         bot.send_message(target, "Specify plugin(s) to unload", nickname)
         return
 
+    plugin_manager = bot.plugin_manager
     for plugin_name in args:
-        if bot.plugin_manager.unload_plugin(plugin_name):
+        if plugin_manager.unload_plugin(plugin_name):
             bot.send_message(
                 target, f"Success: unloaded plugin: {plugin_name}", nickname)
         else:
@@ -374,9 +388,10 @@ def handle_plugin_enable(bot, target: str, nickname: str, args: List[str]):
         bot.send_message(target, "Specify plugin(s) to enable", nickname)
         return
 
+    db = bot.db
+    network_id = bot.factory.config.id
     for plugin_name in args:
-        bot.db.update_plugin_status(
-            bot.factory.config.id, plugin_name, enabled=True)
+        db.update_plugin_status(network_id, plugin_name, enabled=True)
         bot.send_message(
             target,
             f"Success: enabled plugin: {plugin_name}",
@@ -387,15 +402,28 @@ def handle_plugin_disable(bot, target: str, nickname: str, args: List[str]):
         bot.send_message(target, "Specify plugin(s) to disable", nickname)
         return
 
+    db = bot.db
+    network_id = bot.factory.config.id
     for plugin_name in args:
-        bot.db.update_plugin_status(
-            bot.factory.config.id, plugin_name, enabled=False)
+        db.update_plugin_status(network_id, plugin_name, enabled=False)
         bot.send_message(
             target,
             f"Success: disabled plugin: {plugin_name}",
             nickname)
 
 
+_PLUGIN_HANDLERS = {
+    "help": handle_plugin_help,
+    "list": handle_plugin_list,
+    "load": handle_plugin_load,
+    "unload": handle_plugin_unload,
+    "enable": handle_plugin_enable,
+    "disable": handle_plugin_disable,
+}
+
+_PLUGIN_SUBCOMMAND_LIST = ", ".join(_PLUGIN_HANDLERS)
+
+
 __all__ = [
     'PLUGIN_INFO',
     'value_nick',
@@ -18,8 +18,7 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import signal
-from pathlib import Path
+import os
 from twisted.internet import reactor
 
 from core import (
@@ -35,8 +34,8 @@ def main():
     Logger.info("Dunamis starting...")
 
     # Check database exists
-    db_path = Path("dunamis.db")
-    if not db_path.exists():
+    db_path = "dunamis.db"
+    if not os.path.isfile(db_path):
         Logger.error("Database not found. Run 'dunamis-setup' first.")
         return
 
@@ -57,26 +56,21 @@ def main():
         return
 
     # Setup graceful shutdown
-    def shutdown(signum=None, frame=None):
+    def shutdown():
         Logger.info("Shutdown signal received, cleaning up...")
-        
+
         # Disable reconnection for all networks
-        for network_id, factory in network_manager.factories.items():
+        for factory in network_manager.factories.values():
             factory.should_reconnect = False
-        
+
         # Disconnect all networks
         network_manager.disconnect_all()
-        
-        # Stop the reactor
-        if reactor.running:
-            reactor.stop()
-        
+
         Logger.info("Dunamis shut down gracefully")
 
-    # Register signal handlers for graceful shutdown
-    # Use reactor.addSystemEventTrigger instead of signal handlers
-    # This properly integrates with Twisted's event loop
-    reactor.addSystemEventTrigger('before', 'shutdown', lambda: shutdown())
+    # Run cleanup from Twisted's shutdown sequence; the reactor is already
+    # stopping when 'before shutdown' triggers fire, so no reactor.stop()
+    reactor.addSystemEventTrigger('before', 'shutdown', shutdown)
 
     # Connect to all networks
     Logger.info(f"Connecting to {len(networks)} network(s)...")